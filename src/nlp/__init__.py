@@ -23,7 +23,7 @@ __version__ = "0.1.0"
 from pyarrow import total_allocated_bytes
 
 from . import datasets
-from .arrow_dataset import Dataset
+from .arrow_dataset import Dataset, IterableDataset
 from .arrow_reader import ReadInstruction
 from .builder import ArrowBasedBuilder, BeamBasedBuilder, BuilderConfig, DatasetBuilder, GeneratorBasedBuilder
 from .features import ClassLabel, Features, Sequence, Tensor, Translation, TranslationVariableLanguages, Value
@@ -20,7 +20,7 @@ import hashlib
 import logging
 import os
 from collections.abc import Mapping
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
 import numpy as np
 import pyarrow as pa
@@ -557,3 +557,41 @@ class Dataset(object):
                 return Dataset.from_buffer(buf_writer.getvalue())
         else:
             return self
+
+
+class IterableDataset(object):
+    """ A Dataset streamed from Arrow record batches.
+        Only one record batch is loaded in memory at a time while iterating.
+    """
+
+    def __init__(
+        self,
+        generate_batches: Callable[[], Iterator[pa.RecordBatch]],
+        data_files: Optional[List[dict]] = None,
+        info: Optional[Any] = None,
+    ):
+        self._generate_batches = generate_batches
+        self._data_files: List[dict] = data_files if data_files is not None else []
+        self._info = info
+
+    @property
+    def info(self):
+        return self._info
+
+    @property
+    def cache_files(self):
+        return self._data_files
+
+    def iter_batches(self) -> Iterator[pa.RecordBatch]:
+        """ Iterate over the dataset Arrow record batches. """
+        return self._generate_batches()
+
+    def __iter__(self):
+        for pa_batch in self._generate_batches():
+            column_names = pa_batch.schema.names
+            columns = pa_batch.to_pydict()
+            for values in zip(*(columns[name] for name in column_names)):
+                yield dict(zip(column_names, values))
+
+    def __repr__(self):
+        return f"IterableDataset(data_files: {self._data_files})"
@@ -26,12 +26,14 @@ from typing import List, Optional
 import pyarrow as pa
 import pyarrow.parquet
 
-from .arrow_dataset import Dataset
+from .arrow_dataset import Dataset, IterableDataset
 from .naming import filename_for_dataset_split
 from .utils import py_utils
 
 
 _BUFFER_SIZE = 8 << 20  # 8 MiB per file.
+_STREAMING_BATCH_SIZE = 1 << 16  # 65536 examples per streamed record batch.
+
 
 _SUB_SPEC_RE = re.compile(
     r"""
@@ -108,6 +110,22 @@ def _make_file_instructions_from_absolutes(name, name2len, absolute_instructions
     return FileInstructions(num_examples=num_examples, file_instructions=file_instructions,)
 
 
+def _check_columns(columns, available_columns):
+    """Raise a ValueError if some of the requested columns are not available."""
+    missing_columns = [column for column in columns if column not in available_columns]
+    if missing_columns:
+        raise ValueError("Columns %s not in the dataset. Available columns: %s" % (missing_columns, available_columns))
+
+
+def _select_columns(pa_table_or_batch, columns):
+    """Zero-copy projection of an arrow Table or RecordBatch on the given columns."""
+    schema = pa_table_or_batch.schema
+    _check_columns(columns, schema.names)
+    return type(pa_table_or_batch).from_arrays(
+        [pa_table_or_batch.column(schema.get_field_index(column)) for column in columns], names=columns
+    )
+
+
 class BaseReader:
     """
     Build a Dataset object out of Instruction instance(s).
@@ -124,21 +142,43 @@ class BaseReader:
         self._info = info
         self._filetype_suffix = None
 
-    def _get_dataset_from_filename(self, filename_skip_take):
-        """Returns a Dataset instance from given (filename, skip, take)."""
+    def _get_dataset_from_filename(self, filename_skip_take, columns=None):
+        """Returns a Dataset instance from given (filename, skip, take), restricted to `columns` if not None."""
+        raise NotImplementedError
+
+    def _iter_batches_from_filename(self, filename, columns=None):
+        """Yields the record batches of the given file, without loading the whole file."""
         raise NotImplementedError
 
-    def _read_files(self, files, info) -> Dataset:
+    def _iter_files(self, files, columns=None):
+        """Yields the record batches for given file instructions, applying skip/take on the fly."""
+        for f_dict in files:
+            skip = f_dict.get("skip", 0)
+            take = f_dict.get("take")
+            for pa_batch in self._iter_batches_from_filename(f_dict["filename"], columns=columns):
+                if skip >= pa_batch.num_rows:
+                    skip -= pa_batch.num_rows
+                    continue
+                pa_batch = pa_batch.slice(skip, take)
+                skip = 0
+                if take is not None:
+                    take -= pa_batch.num_rows
+                yield pa_batch
+                if take is not None and take <= 0:
+                    break
+
+    def _read_files(self, files, info, columns=None) -> Dataset:
         """Returns Dataset for given file instructions.
 
         Args:
             files: List[dict(filename, skip, take)], the files information.
                 The filenames contain the absolute path, not relative.
                 skip/take indicates which example read in the file: `ds.slice(skip, take)`
+            columns: Optional[List[str]], if not None, only read these columns.
         """
         pa_batches = []
         for f_dict in files:
-            pa_table: pa.Table = self._get_dataset_from_filename(f_dict)
+            pa_table: pa.Table = self._get_dataset_from_filename(f_dict, columns=columns)
             pa_batches.extend(pa_table.to_batches())
         if pa_batches:
             pa_table = pa.Table.from_batches(pa_batches)
@@ -146,7 +186,7 @@ class BaseReader:
         return ds
 
     def read(
-        self, name, instructions, split_infos,
+        self, name, instructions, split_infos, streaming=False, columns=None,
     ):
         """Returns Dataset instance(s).
 
@@ -156,6 +196,9 @@ class BaseReader:
                 Instructions can be string and will then be passed to the Instruction
                 constructor as it.
             split_infos (list of SplitInfo proto): the available splits for dataset.
+            streaming (bool): if True, return IterableDataset instance(s) reading the
+                files batch by batch instead of loading the full tables.
+            columns (list of str, optional): if not None, only read these columns.
 
         Returns:
              a single Dataset instance if instruction is a single
@@ -171,12 +214,12 @@ class BaseReader:
             if not files:
                 msg = 'Instruction "%s" corresponds to no data!' % instruction
                 raise AssertionError(msg)
-            return self.read_files(files=tuple(files),)
+            return self.read_files(files=tuple(files), streaming=streaming, columns=columns)
 
         return py_utils.map_nested(_read_instruction_to_ds, instructions)
 
     def read_files(
-        self, files,
+        self, files, streaming=False, columns=None,
     ):
         """Returns single Dataset instance for the set of file instructions.
 
@@ -184,15 +227,20 @@ class BaseReader:
             files: List[dict(filename, skip, take)], the files information.
                 The filenames contains the relative path, not absolute.
                 skip/take indicates which example read in the file: `ds.skip().take()`
+            streaming (bool): if True, return an IterableDataset instance reading the
+                files batch by batch.
+            columns (list of str, optional): if not None, only read these columns.
 
         Returns:
-             a Dataset instance.
+             a Dataset instance, or an IterableDataset instance if streaming.
         """
         # Prepend path to filename
         files = copy.deepcopy(files)
         for f in files:
             f.update(filename=os.path.join(self._path, f["filename"]))
-        dataset = self._read_files(files=files, info=self._info,)
+        if streaming:
+            return IterableDataset(lambda: self._iter_files(files, columns=columns), data_files=files, info=self._info)
+        dataset = self._read_files(files=files, info=self._info, columns=columns)
         return dataset
 
 
@@ -212,8 +260,8 @@ class ArrowReader(BaseReader):
         super().__init__(path, info)
         self._filetype_suffix = "arrow"
 
-    def _get_dataset_from_filename(self, filename_skip_take):
-        """Returns a Dataset instance from given (filename, skip, take)."""
+    def _get_dataset_from_filename(self, filename_skip_take, columns=None):
+        """Returns a Dataset instance from given (filename, skip, take), restricted to `columns` if not None."""
         filename, skip, take = (
             filename_skip_take["filename"],
             filename_skip_take["skip"] if "skip" in filename_skip_take else None,
@@ -224,8 +272,16 @@ class ArrowReader(BaseReader):
         pa_table = f.read_all()
         if skip is not None and take is not None:
             pa_table = pa_table.slice(skip, take)
+        if columns is not None:
+            pa_table = _select_columns(pa_table, columns)
         return pa_table
 
+    def _iter_batches_from_filename(self, filename, columns=None):
+        """Yields the record batches of the given memory mapped arrow file."""
+        mmap = pa.memory_map(filename)
+        for pa_batch in pa.ipc.open_stream(mmap):
+            yield pa_batch if columns is None else _select_columns(pa_batch, columns)
+
 
 class ParquetReader(BaseReader):
     """
@@ -243,17 +299,41 @@ class ParquetReader(BaseReader):
         super().__init__(path, info)
         self._filetype_suffix = "parquet"
 
-    def _get_dataset_from_filename(self, filename_skip_take):
-        """Returns a Dataset instance from given (filename, skip, take)."""
+    def _get_dataset_from_filename(self, filename_skip_take, columns=None):
+        """Returns a Dataset instance from given (filename, skip, take), restricted to `columns` if not None."""
         filename, skip, take = (
             filename_skip_take["filename"],
             filename_skip_take["skip"] if "skip" in filename_skip_take else None,
             filename_skip_take["take"] if "take" in filename_skip_take else None,
         )
-        pa_table = pa.parquet.read_table(filename, memory_map=True)
-        if skip is not None and take is not None:
-            pa_table = pa_table.slice(skip, take)
-        return pa_table
+        parquet_file = pa.parquet.ParquetFile(filename, memory_map=True)
+        if columns is not None:
+            _check_columns(columns, parquet_file.schema_arrow.names)
+        if skip is None or take is None:
+            return parquet_file.read(columns=columns)
+        # Only read the row groups that overlap with the requested examples, using the footer metadata
+        row_groups, first_row_group_offset, offset = [], 0, 0
+        for i in range(parquet_file.num_row_groups):
+            num_rows = parquet_file.metadata.row_group(i).num_rows
+            if offset + num_rows > skip and offset < skip + take:
+                if not row_groups:
+                    first_row_group_offset = offset
+                row_groups.append(i)
+            offset += num_rows
+        pa_table = parquet_file.read_row_groups(row_groups, columns=columns)
+        return pa_table.slice(skip - first_row_group_offset, take)
+
+    def _iter_batches_from_filename(self, filename, columns=None):
+        """Yields the record batches of the given parquet file, without loading more than a row group at a time."""
+        parquet_file = pa.parquet.ParquetFile(filename, memory_map=True)
+        if columns is not None:
+            _check_columns(columns, parquet_file.schema_arrow.names)
+        if hasattr(parquet_file, "iter_batches"):  # pyarrow>=3.0
+            # Decode batches of bounded size with multiple threads, rather than full row groups
+            yield from parquet_file.iter_batches(batch_size=_STREAMING_BATCH_SIZE, columns=columns, use_threads=True)
+            return
+        for i in range(parquet_file.num_row_groups):
+            yield from parquet_file.read_row_group(i, columns=columns).to_batches()
 
 
 @dataclass(frozen=True)
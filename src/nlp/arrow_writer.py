@@ -194,7 +194,11 @@ class BeamWriter(object):
     """
 
     def __init__(
-        self, data_type: Optional[pa.DataType] = None, schema: Optional[pa.Schema] = None, path: Optional[str] = None,
+        self,
+        data_type: Optional[pa.DataType] = None,
+        schema: Optional[pa.Schema] = None,
+        path: Optional[str] = None,
+        codec: str = "none",
     ):
         if data_type is None and schema is None:
             raise ValueError("At least one of data_type and schema must be provided.")
@@ -209,10 +213,12 @@ class BeamWriter(object):
             self._type: pa.DataType = pa.struct(field for field in self._schema)
 
         self._path = path
+        self._codec = codec
         self._num_examples = None
         self._pcoll_outputs_metadata = []
 
     def write_from_pcollection(self, pcoll_examples):
+        """Add to the pipeline the transforms writing the encoded examples of `pcoll_examples`, without keys."""
         import apache_beam as beam
 
         # create some metadata that will be used in .finalize()
@@ -235,11 +241,8 @@ class BeamWriter(object):
         )
 
         # save dataset
-        return (
-            pcoll_examples
-            | "Get values" >> beam.Values()
-            | "Save to parquet"
-            >> beam.io.parquetio.WriteToParquet(self._path, self._schema, num_shards=1, shard_name_template="")
+        return pcoll_examples | "Save to parquet" >> beam.io.parquetio.WriteToParquet(
+            self._path, self._schema, codec=self._codec, num_shards=1, shard_name_template=""
         )
 
     def finalize(self):
@@ -18,21 +18,21 @@
 
 import abc
 import contextlib
+import functools
 import inspect
 import logging
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Union
 
-import pyarrow as pa
-
 from . import utils
 from .arrow_reader import ArrowReader, ParquetReader
 from .arrow_writer import ArrowWriter, BeamWriter
-from .features import Features, Value
+from .features import Features
 from .info import DATASET_INFOS_DICT_FILE_NAME, DatasetInfo, DatasetInfosDict
-from .naming import camelcase_to_snakecase, filename_prefix_for_split
+from .naming import camelcase_to_snakecase
 from .splits import Split, SplitDict
 from .utils.download_manager import DownloadManager, GenerateMode
 from .utils.file_utils import HF_DATASETS_CACHE, DownloadConfig
@@ -45,6 +45,16 @@ FORCE_REDOWNLOAD = GenerateMode.FORCE_REDOWNLOAD
 REUSE_CACHE_IF_EXISTS = GenerateMode.REUSE_CACHE_IF_EXISTS
 REUSE_DATASET_IF_EXISTS = GenerateMode.REUSE_DATASET_IF_EXISTS
 
+# Sentinel for a cached stat result that has not been computed yet.
+_MISSING = object()
+
+# Number of generated examples between two progress bar updates.
+_PROGRESS_BAR_CHUNK_SIZE = 1024
+
+# Bounds of the batches of examples encoded at once in Beam pipelines.
+_BEAM_MIN_BATCH_SIZE = 512
+_BEAM_MAX_BATCH_SIZE = 4096
+
 
 class InvalidConfigName(ValueError):
     pass
@@ -113,6 +123,20 @@ class DatasetBuilder:
     # displayed in the dataset documentation.
     MANUAL_DOWNLOAD_INSTRUCTIONS = None
 
+    # Snake case name of the class and mapping name -> config of BUILDER_CONFIGS,
+    # both computed once per class in __init_subclass__.
+    _snake_name = camelcase_to_snakecase("DatasetBuilder")
+    _builder_configs = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._snake_name = camelcase_to_snakecase(cls.__name__)
+        config_dict = {config.name: config for config in cls.BUILDER_CONFIGS}
+        if len(config_dict) != len(cls.BUILDER_CONFIGS):
+            names = [config.name for config in cls.BUILDER_CONFIGS]
+            raise ValueError("Names in BUILDER_CONFIGS must not be duplicated. Got %s" % names)
+        cls._builder_configs = config_dict
+
     def __init__(
         self, cache_dir=None, name=None, **config_kwargs,
     ):
@@ -129,7 +153,9 @@ class DatasetBuilder:
 
         """
         # DatasetBuilder name
-        self.name = camelcase_to_snakecase(self.__class__.__name__)
+        self.name = self._snake_name
+        # File name of the prepared arrow files, to format with the split name
+        self._arrow_fname_template = self.name + "-%s.arrow"
 
         # Prepare config: DatasetConfig contains name, version and description but can be extended by each dataset
         config_kwargs = dict((key, value) for key, value in config_kwargs.items() if value is not None)
@@ -147,7 +173,8 @@ class DatasetBuilder:
         # prepare data dirs
         self._cache_dir_root = os.path.expanduser(cache_dir or HF_DATASETS_CACHE)
         self._cache_dir = self._build_cache_dir()
-        if os.path.exists(self._cache_dir):
+        self._cache_dir_stat = _MISSING
+        if self._cache_dir_exists():
             logger.info("Overwrite dataset info from restored data version.")
             self.info = DatasetInfo.from_directory(self._cache_dir)
 
@@ -172,22 +199,23 @@ class DatasetBuilder:
             Uses the first configuration in self.BUILDER_CONFIGS if name is None
             config_kwargs override the defaults kwargs in config
         """
+        builder_configs = self.builder_configs
         builder_config = None
         if name is None and self.BUILDER_CONFIGS and not config_kwargs:
             if len(self.BUILDER_CONFIGS) > 1:
                 example_of_usage = "load_dataset('{}', '{}')".format(self.name, self.BUILDER_CONFIGS[0].name)
                 raise ValueError(
                     "Config name is missing."
-                    "\nPlease pick one among the available configs: %s" % list(self.builder_configs.keys())
+                    "\nPlease pick one among the available configs: %s" % list(builder_configs.keys())
                     + "\nExample of usage:\n\t`{}`".format(example_of_usage)
                 )
             builder_config = self.BUILDER_CONFIGS[0]
             logger.info("No config specified, defaulting to first: %s/%s", self.name, builder_config.name)
         if isinstance(name, str):
-            builder_config = self.builder_configs.get(name)
+            builder_config = builder_configs.get(name)
             if builder_config is None and self.BUILDER_CONFIGS:
                 raise ValueError(
-                    "BuilderConfig %s not found. Available: %s" % (name, list(self.builder_configs.keys()))
+                    "BuilderConfig %s not found. Available: %s" % (name, list(builder_configs.keys()))
                 )
         if not builder_config:
             if name is not None:
@@ -203,15 +231,15 @@ class DatasetBuilder:
         name = builder_config.name
         if not name:
             raise ValueError("BuilderConfig must have a name, got %s" % name)
-        is_custom = name not in self.builder_configs
+        is_custom = name not in builder_configs
         if is_custom:
             logger.warning("Using custom data configuration %s", name)
         else:
-            if builder_config is not self.builder_configs[name]:
+            if builder_config is not builder_configs[name]:
                 raise ValueError(
                     "Cannot name a custom BuilderConfig the same as an available "
                     "BuilderConfig. Change the name. Available BuilderConfigs: %s"
-                    % (list(self.builder_configs.keys()))
+                    % (list(builder_configs.keys()))
                 )
             if not builder_config.version:
                 raise ValueError("BuilderConfig %s must have a version" % name)
@@ -221,19 +249,23 @@ class DatasetBuilder:
 
     @utils.classproperty
     @classmethod
-    @utils.memoize()
     def builder_configs(cls):
         """Pre-defined list of configurations for this builder class."""
-        config_dict = {config.name: config for config in cls.BUILDER_CONFIGS}
-        if len(config_dict) != len(cls.BUILDER_CONFIGS):
-            names = [config.name for config in cls.BUILDER_CONFIGS]
-            raise ValueError("Names in BUILDER_CONFIGS must not be duplicated. Got %s" % names)
-        return config_dict
+        return cls._builder_configs
 
     @property
     def cache_dir(self):
         return self._cache_dir
 
+    def _cache_dir_exists(self):
+        """Whether the cache dir exists. The `os.stat` result is cached until invalidated."""
+        if self._cache_dir_stat is _MISSING:
+            try:
+                self._cache_dir_stat = os.stat(self._cache_dir)
+            except FileNotFoundError:
+                self._cache_dir_stat = None
+        return self._cache_dir_stat is not None
+
     def _relative_data_dir(self, with_version=True):
         """Relative path of this dataset in cache_dir."""
         builder_data_dir = self.name
@@ -242,27 +274,27 @@ class DatasetBuilder:
             builder_data_dir = os.path.join(builder_data_dir, builder_config.name)
         if not with_version:
             return builder_data_dir
-
-        version = self.config.version
-        version_data_dir = os.path.join(builder_data_dir, str(version))
-        return version_data_dir
+        return os.path.join(builder_data_dir, str(self.config.version))
 
     def _build_cache_dir(self):
         """Return the data directory for the current version."""
         builder_data_dir = os.path.join(self._cache_dir_root, self._relative_data_dir(with_version=False))
-        version_data_dir = os.path.join(self._cache_dir_root, self._relative_data_dir(with_version=True))
+        version_data_dir = os.path.join(builder_data_dir, str(self.config.version))
 
         def _other_versions_on_disk():
             """Returns previous versions on disk."""
-            if not os.path.exists(builder_data_dir):
-                return []
-
             version_dirnames = []
-            for dir_name in os.listdir(builder_data_dir):
-                try:
-                    version_dirnames.append((utils.Version(dir_name), dir_name))
-                except ValueError:  # Invalid version (ex: incomplete data dir)
-                    pass
+            try:
+                with os.scandir(builder_data_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        try:
+                            version_dirnames.append((utils.Version(entry.name), entry.name))
+                        except ValueError:  # Invalid version (ex: incomplete data dir)
+                            pass
+            except FileNotFoundError:
+                return []
             version_dirnames.sort(reverse=True)
             return version_dirnames
 
@@ -309,6 +341,7 @@ class DatasetBuilder:
         ignore_verifications: bool = False,
         save_infos: bool = False,
         dl_manager: Optional[DownloadManager] = None,
+        num_proc: Optional[int] = None,
         **download_and_prepare_kwargs,
     ):
         """Downloads and prepares dataset for reading.
@@ -319,10 +352,11 @@ class DatasetBuilder:
             ignore_verifications (bool): Ignore the verifications of the downloaded/processed dataset information (checksums/size/splits/...)
             save_infos (bool): Save the dataset information (checksums/size/splits/...)
             dl_manager (Optional ``nlp.DownloadManager``): specific Download Manger to use
+            num_proc (Optional ``int``): number of processes used to prepare the splits in parallel - Default to preparing them sequentially
         """
         download_mode = GenerateMode(download_mode or GenerateMode.REUSE_DATASET_IF_EXISTS)
 
-        data_exists = os.path.exists(self._cache_dir)
+        data_exists = self._cache_dir_exists()
         if data_exists and download_mode == REUSE_DATASET_IF_EXISTS:
             logger.info("Reusing dataset %s (%s)", self.name, self._cache_dir)
             return
@@ -338,10 +372,13 @@ class DatasetBuilder:
             )
 
         logger.info("Generating dataset %s (%s)", self.name, self._cache_dir)
-        if not utils.has_sufficient_disk_space(self.info.size_in_bytes or 0, directory=self._cache_dir_root):
+        # The size is unknown for custom datasets: the disk usage check would be meaningless
+        if self.info.size_in_bytes and not utils.has_sufficient_disk_space(
+            self.info.size_in_bytes, directory=self._cache_dir_root
+        ):
             raise IOError(
                 "Not enough disk space. Needed: {} (download: {}, generated: {})".format(
-                    utils.size_str(self.info.size_in_bytes or 0),
+                    utils.size_str(self.info.size_in_bytes),
                     utils.size_str(self.info.download_size or 0),
                     utils.size_str(self.info.dataset_size or 0),
                 )
@@ -376,13 +413,16 @@ class DatasetBuilder:
         def incomplete_dir(dirname):
             """Create temporary dir for dirname and rename on exit."""
             tmp_dir = dirname + ".incomplete"
+            utils.rmtree_leftover_trash(dirname)
             os.makedirs(tmp_dir)
             try:
                 yield tmp_dir
                 if os.path.isdir(dirname):
-                    shutil.rmtree(dirname)
+                    utils.rmtree_in_background(dirname)
                 os.rename(tmp_dir, dirname)
             finally:
+                # The cache dir may have been created or replaced
+                self._cache_dir_stat = _MISSING
                 if os.path.exists(tmp_dir):
                     shutil.rmtree(tmp_dir)
 
@@ -392,6 +432,9 @@ class DatasetBuilder:
             # it to every sub function.
             with utils.temporary_assignment(self, "_cache_dir", tmp_data_dir):
                 verify_infos = not save_infos and not ignore_verifications
+                # Only forward num_proc if set, to support subclasses overriding _download_and_prepare without it
+                if num_proc is not None:
+                    download_and_prepare_kwargs["num_proc"] = num_proc
                 self._download_and_prepare(
                     dl_manager=dl_manager, verify_infos=verify_infos, **download_and_prepare_kwargs
                 )
@@ -411,7 +454,7 @@ class DatasetBuilder:
             f"Subsequent calls will reuse this data."
         )
 
-    def _download_and_prepare(self, dl_manager, verify_infos, **prepare_split_kwargs):
+    def _download_and_prepare(self, dl_manager, verify_infos, num_proc=None, **prepare_split_kwargs):
         """Downloads and prepares dataset for reading.
 
         This is the internal implementation to overwrite called when user calls
@@ -422,14 +465,13 @@ class DatasetBuilder:
             dl_manager: (DownloadManager) `DownloadManager` used to download and cache
                 data.
             verify_infos: bool, if True, do not perform checksums and size tests.
+            num_proc: Optional int, if > 1, the splits are prepared in parallel in that many processes.
             prepare_split_kwargs: Additional options.
         """
-        os.makedirs(self._cache_dir, exist_ok=True)
-
         # Generating data for all splits
         split_dict = SplitDict(dataset_name=self.name)
         split_generators_kwargs = self._make_split_generators_kwargs(prepare_split_kwargs)
-        split_generators = self._split_generators(dl_manager, **split_generators_kwargs)
+        split_generators = list(self._split_generators(dl_manager, **split_generators_kwargs))
         # Checksums verification
         if verify_infos:
             verify_checksums(self.info.download_checksums, dl_manager.get_recorded_sizes_checksums())
@@ -440,15 +482,33 @@ class DatasetBuilder:
                     "union of all splits, so cannot be used as key in "
                     "._split_generator()."
                 )
-
-            logger.info("Generating split %s", split_generator.split_info.name)
             split_dict.add(split_generator.split_info)
 
-            try:
-                # Prepare split will record examples associated to the split
-                self._prepare_split(split_generator, **prepare_split_kwargs)
-            except OSError:
-                raise OSError("Cannot find data file. " + (self.MANUAL_DOWNLOAD_INSTRUCTIONS or ""))
+        if num_proc is not None and num_proc > 1 and len(split_generators) > 1:
+            # The splits are independent: prepare them in parallel, then merge the
+            # results back in order since workers only update their own copies.
+            logger.info("Generating %d splits with %d processes", len(split_generators), num_proc)
+            with ProcessPoolExecutor(max_workers=min(num_proc, len(split_generators))) as executor:
+                futures = [
+                    executor.submit(_prepare_split_in_subprocess, self, split_generator, prepare_split_kwargs)
+                    for split_generator in split_generators
+                ]
+                for split_generator, future in zip(split_generators, futures):
+                    try:
+                        num_examples, num_bytes, features = future.result()
+                    except OSError:
+                        raise OSError("Cannot find data file. " + (self.MANUAL_DOWNLOAD_INSTRUCTIONS or ""))
+                    split_generator.split_info.num_examples = num_examples
+                    split_generator.split_info.num_bytes = num_bytes
+                    self.info.features = features
+        else:
+            for split_generator in split_generators:
+                logger.info("Generating split %s", split_generator.split_info.name)
+                try:
+                    # Prepare split will record examples associated to the split
+                    self._prepare_split(split_generator, **prepare_split_kwargs)
+                except OSError:
+                    raise OSError("Cannot find data file. " + (self.MANUAL_DOWNLOAD_INSTRUCTIONS or ""))
 
         if verify_infos:
             verify_splits(self.info.splits, split_dict)
@@ -461,8 +521,16 @@ class DatasetBuilder:
         del prepare_split_kwargs
         return {}
 
-    def as_dataset(self, split: Optional[Split] = None):
+    def as_dataset(
+        self, split: Optional[Split] = None, streaming: bool = False, columns: Optional[List[str]] = None
+    ):
         """ Return a Dataset for the specified split.
+
+        Args:
+            split (`nlp.Split`): which subset of the data to return - Default to all splits.
+            streaming (bool): return an `nlp.IterableDataset` reading the prepared files batch by batch
+                instead of a `Dataset` backed by a full Arrow table.
+            columns (list of str, optional): only read these columns - Default to all columns.
         """
         logger.info("Constructing Dataset for split %s, from %s", split, self._cache_dir)
         if not os.path.exists(self._cache_dir):
@@ -480,19 +548,21 @@ class DatasetBuilder:
             split = {s: s for s in self.info.splits}
 
         # Create a dataset for each of the given splits
-        datasets = utils.map_nested(self._build_single_dataset, split, map_tuple=True)
+        datasets = utils.map_nested(
+            functools.partial(self._build_single_dataset, streaming=streaming, columns=columns), split, map_tuple=True
+        )
         return datasets
 
-    def _build_single_dataset(self, split):
+    def _build_single_dataset(self, split, streaming=False, columns=None):
         """as_dataset for a single split."""
         if isinstance(split, str):
             split = Split(split)
 
         # Build base dataset
-        ds = self._as_dataset(split=split,)
+        ds = self._as_dataset(split=split, streaming=streaming, columns=columns)
         return ds
 
-    def _as_dataset(self, split: Split = Split.TRAIN):
+    def _as_dataset(self, split: Split = Split.TRAIN, streaming: bool = False, columns: Optional[List[str]] = None):
         """Constructs a `Dataset`.
 
         This is the internal implementation to overwrite called when user calls
@@ -501,13 +571,19 @@ class DatasetBuilder:
 
         Args:
             split: `nlp.Split` which subset of the data to read.
+            streaming: bool, if True, return an `IterableDataset` instead.
+            columns: list of str, if not None, only read these columns.
 
         Returns:
             `Dataset`
         """
 
         ds = ArrowReader(self._cache_dir, self.info).read(
-            name=self.name, instructions=split, split_infos=self.info.splits.values(),
+            name=self.name,
+            instructions=split,
+            split_infos=self.info.splits.values(),
+            streaming=streaming,
+            columns=columns,
         )
         return ds
 
@@ -569,6 +645,14 @@ class DatasetBuilder:
         raise NotImplementedError()
 
 
+def _prepare_split_in_subprocess(builder, split_generator, prepare_split_kwargs):
+    """Prepare a single split in a worker process and return what the parent builder needs to record."""
+    logger.info("Generating split %s", split_generator.split_info.name)
+    builder._prepare_split(split_generator, **prepare_split_kwargs)
+    split_info = split_generator.split_info
+    return split_info.num_examples, split_info.num_bytes, builder.info.features
+
+
 class GeneratorBasedBuilder(DatasetBuilder):
     """Base class for datasets with data generation based on dict generators.
 
@@ -615,15 +699,30 @@ class GeneratorBasedBuilder(DatasetBuilder):
     def _prepare_split(self, split_generator):
         split_info = split_generator.split_info
 
-        fname = "{}-{}.arrow".format(self.name, split_generator.name)
+        fname = self._arrow_fname_template % split_generator.name
         fpath = os.path.join(self._cache_dir, fname)
         examples_type = self.info.features.type
         writer = ArrowWriter(data_type=examples_type, path=fpath, writer_batch_size=self._writer_batch_size)
 
         generator = self._generate_examples(**split_generator.gen_kwargs)
-        for key, record in utils.tqdm(generator, unit=" examples", total=split_info.num_examples, leave=False):
-            example = self.info.features.encode_example(record)
-            writer.write(example)
+        # Encode and write the examples column-wise, one writer batch at a time
+        encoders = self.info.features.compile_encoders()
+        batch = []
+        # Report progress by chunks to keep tqdm out of the per-example loop
+        num_unreported = 0
+        with utils.tqdm(unit=" examples", total=split_info.num_examples, leave=False) as pbar:
+            for key, record in generator:
+                batch.append(record)
+                num_unreported += 1
+                if num_unreported >= _PROGRESS_BAR_CHUNK_SIZE:
+                    pbar.update(num_unreported)
+                    num_unreported = 0
+                if len(batch) >= writer.writer_batch_size:
+                    writer.write_batch(self.info.features.encode_batch(batch, encoders=encoders))
+                    batch = []
+            if batch:
+                writer.write_batch(self.info.features.encode_batch(batch, encoders=encoders))
+            pbar.update(num_unreported)
         num_examples, num_bytes = writer.finalize()
 
         assert num_examples == num_examples, f"Expected to write {split_info.num_examples} but wrote {num_examples}"
@@ -667,7 +766,7 @@ class ArrowBasedBuilder(DatasetBuilder):
         raise NotImplementedError()
 
     def _prepare_split(self, split_generator):
-        fname = "{}-{}.arrow".format(self.name, split_generator.name)
+        fname = self._arrow_fname_template % split_generator.name
         fpath = os.path.join(self._cache_dir, fname)
 
         writer = ArrowWriter(path=fpath)
@@ -679,26 +778,30 @@ class ArrowBasedBuilder(DatasetBuilder):
 
         split_generator.split_info.num_examples = num_examples
         split_generator.split_info.num_bytes = num_bytes
-        features = {}
+        self.info.features = Features.from_arrow_schema(writer.schema)
 
-        def parse_schema(schema, schema_dict):
-            for field in schema:
-                if pa.types.is_struct(field.type):
-                    schema_dict[field.name] = {}
-                    parse_schema(field.type, schema_dict[field.name])
-                elif pa.types.is_list(field.type) and pa.types.is_struct(field.type.value_type):
-                    schema_dict[field.name] = {}
-                    parse_schema(field.type.value_type, schema_dict[field.name])
-                else:
-                    schema_dict[field.name] = Value(str(field.type))
 
-        parse_schema(writer.schema, features)
-        self.info.features = Features(features)
+def _encode_examples_batch(examples, features, encoders):
+    """Encode a batch of examples column by column, and split it back into examples.
+    Defined at the module level to be pickled by reference in Beam pipelines.
+    """
+    columns = features.encode_batch(examples, encoders=encoders)
+    return (dict(zip(columns, row)) for row in zip(*columns.values()))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parameter_names(func):
+    """Names of the parameters of a function, inspected once per function."""
+    return tuple(inspect.signature(func).parameters)
 
 
 class BeamBasedBuilder(DatasetBuilder):
     """Beam based Builder."""
 
+    # Compression codec of the prepared parquet files, any codec supported by pyarrow
+    # ("zstd", "snappy", "gzip"...) or "none". Columns are dictionary encoded in any case.
+    PARQUET_CODEC = "zstd"
+
     def __init__(self, *args, **kwargs):
         super(BeamBasedBuilder, self).__init__(*args, **kwargs)
         self._beam_runner = kwargs.get("beam_runner")
@@ -710,7 +813,7 @@ class BeamBasedBuilder(DatasetBuilder):
         # it's in the call signature of `_split_generators()`.
         # This allows for global preprocessing in beam.
         split_generators_kwargs = {}
-        split_generators_arg_names = inspect.signature(self._split_generators).parameters.keys()
+        split_generators_arg_names = _get_parameter_names(type(self)._split_generators)
         if "pipeline" in split_generators_arg_names:
             split_generators_kwargs["pipeline"] = prepare_split_kwargs["pipeline"]
         return split_generators_kwargs
@@ -750,7 +853,7 @@ class BeamBasedBuilder(DatasetBuilder):
         """
         raise NotImplementedError()
 
-    def _as_dataset(self, split: Split = Split.TRAIN):
+    def _as_dataset(self, split: Split = Split.TRAIN, streaming: bool = False, columns: Optional[List[str]] = None):
         """Constructs a `Dataset`.
 
         This is the internal implementation to overwrite called when user calls
@@ -759,20 +862,29 @@ class BeamBasedBuilder(DatasetBuilder):
 
         Args:
             split: `nlp.Split` which subset of the data to read.
+            streaming: bool, if True, return an `IterableDataset` instead.
+            columns: list of str, if not None, only read these columns.
 
         Returns:
             `Dataset`
         """
 
         ds = ParquetReader(self._cache_dir, self.info).read(
-            name=self.name, instructions=split, split_infos=self.info.splits.values(),
+            name=self.name,
+            instructions=split,
+            split_infos=self.info.splits.values(),
+            streaming=streaming,
+            columns=columns,
         )
         return ds
 
-    def _download_and_prepare(self, dl_manager, verify_infos):
+    def _download_and_prepare(self, dl_manager, verify_infos, num_proc=None):
         # Create the Beam pipeline and forward it to _prepare_split
         import apache_beam as beam
 
+        if num_proc is not None and num_proc > 1:
+            logger.warning("num_proc is ignored for Beam datasets: the splits are processed by the Beam runner.")
+
         beam_runner = self._beam_runner
         beam_options = self._beam_options
 
@@ -785,10 +897,13 @@ class BeamBasedBuilder(DatasetBuilder):
                 "Default values will be used."
             )
 
-        beam_options = beam_options or beam.options.pipeline_options.PipelineOptions()
         # Beam type checking assumes transforms multiple outputs are of same type,
         # which is not our case. Plus it doesn't handle correctly all types, so we
         # are better without it.
+        beam_options = beam_options or beam.options.pipeline_options.PipelineOptions(
+            flags=["--no_pipeline_type_check"]
+        )
+        # Also disable it on user provided options
         beam_options.view_as(beam.options.pipeline_options.TypeOptions).pipeline_type_check = False
         # Use a single pipeline for all splits
         with beam.Pipeline(runner=beam_runner, options=beam_options,) as pipeline:
@@ -798,8 +913,12 @@ class BeamBasedBuilder(DatasetBuilder):
 
         # Update `info.splits`.
         split_dict = self.info.splits
-        for split_name, beam_writer in self._beam_writers.items():
-            num_examples, num_bytes = beam_writer.finalize()
+        # The writers are independent and their finalization is dominated by file system calls,
+        # which can be slow on remote file systems: finalize them concurrently.
+        split_names = list(self._beam_writers)
+        with ThreadPoolExecutor(max_workers=max(len(split_names), 1)) as executor:
+            results = list(executor.map(lambda split_name: self._beam_writers[split_name].finalize(), split_names))
+        for split_name, (num_examples, num_bytes) in zip(split_names, results):
             split_info = split_dict[split_name]
             split_info.num_examples = num_examples
             split_info.num_bytes = num_bytes
@@ -807,20 +926,26 @@ class BeamBasedBuilder(DatasetBuilder):
     def _prepare_split(self, split_generator, pipeline):
         import apache_beam as beam
 
-        os.makedirs(self._cache_dir, exist_ok=True)
-
         split_name = split_generator.split_info.name
-        output_prefix = filename_prefix_for_split(self.name, split_name)
-        output_prefix = os.path.join(self._cache_dir, output_prefix)
 
         # To write examples to disk:
         fname = "{}-{}.parquet".format(self.name, split_name)
         fpath = os.path.join(self._cache_dir, fname)
         examples_type = self.info.features.type
-        beam_writer = BeamWriter(examples_type, path=fpath)
+        beam_writer = BeamWriter(examples_type, path=fpath, codec=self.PARQUET_CODEC)
         self._beam_writers[split_name] = beam_writer
 
-        encode_example = self.info.features.encode_example
+        # Resolve the column encoders once when building the pipeline, instead of once per batch
+        encoders = self.info.features.compile_encoders()
+        # The examples are written as is if encoding them wouldn't change them (e.g. only string features)
+        needs_encoding = self.info.features.requires_encoding()
+
+        # On distributed runners, break the fusion between the generation and the encoding of the examples,
+        # otherwise the encoding runs on the workers that generated the examples, which can be only a few.
+        # This is skipped for the local direct runner, where it would only add a shuffle.
+        from apache_beam.runners.direct.direct_runner import BundleBasedDirectRunner, DirectRunner
+
+        reshuffle = not isinstance(pipeline.runner, (BundleBasedDirectRunner, DirectRunner))
 
         # Note: We need to wrap the pipeline in a PTransform to avoid re-using the
         # same label names for each split
@@ -829,7 +954,18 @@ class BeamBasedBuilder(DatasetBuilder):
             """PTransformation which build a single split."""
             # Encode the PCollection
             pcoll_examples = self._build_pcollection(pipeline, **split_generator.gen_kwargs)
-            pcoll_examples |= "Encode" >> beam.Map(lambda key_ex: (key_ex[0], encode_example(key_ex[1])))
+            # The keys are not written, drop them before they go through the shuffles
+            pcoll_examples |= "Drop keys" >> beam.Values()
+            if needs_encoding:
+                pcoll_examples |= "Batch" >> beam.BatchElements(
+                    min_batch_size=_BEAM_MIN_BATCH_SIZE, max_batch_size=_BEAM_MAX_BATCH_SIZE
+                )
+                if reshuffle:
+                    # Shuffle whole batches: the shuffle serializes one element per batch instead of one per example
+                    pcoll_examples |= "Reshuffle" >> beam.Reshuffle()
+                pcoll_examples |= "Encode" >> beam.FlatMap(
+                    _encode_examples_batch, features=self.info.features, encoders=encoders
+                )
             return beam_writer.write_from_pcollection(pcoll_examples)
 
         # Add the PCollection to the pipeline
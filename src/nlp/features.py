@@ -69,6 +69,17 @@ class Value:
         else:
             return value
 
+    def encode_batch(self, values):
+        """ Same as `encode_example` for a list of values, with a single type dispatch for the whole column. """
+        if pa.types.is_boolean(self.pa_type):
+            return list(map(bool, values))
+        elif pa.types.is_integer(self.pa_type):
+            return list(map(int, values))
+        elif pa.types.is_floating(self.pa_type):
+            return list(map(float, values))
+        else:
+            return list(values)
+
 
 @dataclass
 class Tensor:
@@ -424,6 +435,40 @@ def encode_nested_example(schema, obj):
     return obj
 
 
+def requires_encoding(schema) -> bool:
+    """ Return False if `encode_nested_example` returns the examples of the given feature unchanged. """
+    if isinstance(schema, dict):
+        return any(requires_encoding(sub_schema) for sub_schema in schema.values())
+    elif isinstance(schema, (list, tuple)):
+        return requires_encoding(schema[0])
+    elif isinstance(schema, Sequence):
+        # Sequences of dict also accept lists of dict, which are converted to dicts of lists
+        return isinstance(schema.feature, dict) or requires_encoding(schema.feature)
+    elif isinstance(schema, (ClassLabel, TranslationVariableLanguages)):
+        return True
+    elif isinstance(schema, Value):
+        # Numbers and booleans are cast, other values are left as is
+        return (
+            pa.types.is_boolean(schema.pa_type)
+            or pa.types.is_integer(schema.pa_type)
+            or pa.types.is_floating(schema.pa_type)
+        )
+    return False
+
+
+def get_column_encoder(schema):
+    """ Return a function encoding a list of values of the given feature, resolved once for the feature type. """
+    if isinstance(schema, Value):
+        return schema.encode_batch
+    elif isinstance(schema, (ClassLabel, TranslationVariableLanguages)):
+        encode_example = schema.encode_example
+        return lambda objs: [encode_example(obj) for obj in objs]
+    elif isinstance(schema, (dict, list, tuple, Sequence)):
+        return lambda objs: [encode_nested_example(schema, obj) for obj in objs]
+    # Other objects are directly convertible to a native Arrow type (like Translation and Tensor)
+    return list
+
+
 def generate_from_dict(obj: Any):
     """ Regenerate the nested feature object from a serialized dict.
         We use the '_type' fields to get the dataclass name to load.
@@ -441,6 +486,15 @@ def generate_from_dict(obj: Any):
     return class_type(**obj)
 
 
+def arrow_to_dtype(pa_type: pa.DataType) -> str:
+    """ Name of a primitive Arrow datatype that can be used as a `Value` dtype.
+        `str(pa_type)` is not always valid, e.g. it is "double" for `pa.float64()`.
+    """
+    if pa.types.is_floating(pa_type):
+        return f"float{pa_type.bit_width}"
+    return str(pa_type)
+
+
 def generate_from_arrow(pa_type: pa.DataType):
     if isinstance(pa_type, pa.StructType):
         return {field.name: generate_from_arrow(field.type) for field in pa_type}
@@ -451,7 +505,7 @@ def generate_from_arrow(pa_type: pa.DataType):
     elif isinstance(pa_type, pa.DictionaryType):
         raise NotImplementedError  # TODO(thom) this will need access to the dictionary as well (for labels). I.e. to the py_table
     elif isinstance(pa_type, pa.DataType):
-        return Value(dtype=str(pa_type))
+        return Value(dtype=arrow_to_dtype(pa_type))
     else:
         return ValueError(f"Cannot convert {pa_type} to a Feature type.")
 
@@ -466,6 +520,11 @@ class Features(dict):
         obj = generate_from_arrow(pa_type)
         return cls(**obj)
 
+    @classmethod
+    def from_arrow_schema(cls, pa_schema: pa.Schema):
+        obj = {field.name: generate_from_arrow(field.type) for field in pa_schema}
+        return cls(**obj)
+
     @classmethod
     def from_dict(cls, dic):
         obj = generate_from_dict(dic)
@@ -473,3 +532,21 @@ class Features(dict):
 
     def encode_example(self, example):
         return encode_nested_example(self, example)
+
+    def requires_encoding(self):
+        """ Return False if `encode_example` returns the examples unchanged, so that encoding can be skipped. """
+        return requires_encoding(self)
+
+    def compile_encoders(self):
+        """ Resolve the column encoder of each feature once, as a tuple of `(feature_name, encode_column)`.
+            Can be passed to `encode_batch` to encode many batches with the same features.
+        """
+        return tuple((key, get_column_encoder(schema)) for key, schema in self.items())
+
+    def encode_batch(self, batch, encoders=None):
+        """ Encode a list of examples into a dict of columns `{feature_name: [encoded values]}`,
+            ready to be written with `ArrowWriter.write_batch`.
+        """
+        if encoders is None:
+            encoders = self.compile_encoders()
+        return {key: encode_column([example[key] for example in batch]) for key, encode_column in encoders}
@@ -49,6 +49,10 @@ DATASET_INFOS_DICT_FILE_NAME = "dataset_infos.json"
 LICENSE_FILENAME = "LICENSE"
 METRIC_INFO_FILENAME = "metric_info.json"
 
+# Content of the dataset info files read by DatasetInfo.from_directory: {path: (file identity, text)}.
+# The identity (inode, size, modification time) changes when a prepared dataset is regenerated.
+_dataset_info_texts = {}
+
 
 @dataclass
 class SupervisedKeysData:
@@ -146,15 +150,21 @@ class DatasetInfo:
         if not dataset_info_dir:
             raise ValueError("Calling DatasetInfo.from_directory() with undefined dataset_info_dir.")
 
-        with open(os.path.join(dataset_info_dir, DATASET_INFO_FILENAME), "r") as f:
-            dataset_info_dict = json.load(f)
-        return cls(**dataset_info_dict)
+        dataset_info_path = os.path.join(dataset_info_dir, DATASET_INFO_FILENAME)
+        stat = os.stat(dataset_info_path)
+        file_identity = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        cached_identity, dataset_info_text = _dataset_info_texts.get(dataset_info_path, (None, None))
+        if cached_identity != file_identity:
+            with open(dataset_info_path, "r") as f:
+                dataset_info_text = f.read()
+            _dataset_info_texts[dataset_info_path] = (file_identity, dataset_info_text)
+        return cls(**json.loads(dataset_info_text))
 
     def update(self, other_dataset_info, ignore_none=True):
-        self_dict = self.__dict__
-        self_dict.update(
-            **{k: v for k, v in other_dataset_info.__dict__.items() if (v is not None or not ignore_none)}
-        )
+        for name in self.__dataclass_fields__:
+            value = getattr(other_dataset_info, name)
+            if value is not None or not ignore_none:
+                setattr(self, name, value)
 
 
 class DatasetInfosDict(dict):
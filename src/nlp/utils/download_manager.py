@@ -17,8 +17,10 @@
 """Download manager interface."""
 
 import enum
+import functools
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from .file_utils import cached_path, get_from_cache, hash_url_to_filename
 from .info_utils import get_size_checksum_dict
@@ -128,9 +130,18 @@ class DownloadManager(object):
             downloaded_path(s): `str`, The downloaded paths matching the given input
                 url_or_urls.
         """
-        downloaded_path_or_paths = map_nested(
-            lambda url_or_urls: cached_path(url_or_urls, download_config=self._download_config,), url_or_urls,
-        )
+        download_func = functools.partial(cached_path, download_config=self._download_config)
+        # Download each distinct url once, concurrently if possible, then map the paths back to url_or_urls
+        urls = []
+        map_nested(urls.append, url_or_urls)
+        urls = list(dict.fromkeys(urls))
+        num_threads = self._download_config.num_threads if self._download_config is not None else 1
+        if len(urls) > 1 and num_threads > 1:
+            with ThreadPoolExecutor(max_workers=min(num_threads, len(urls))) as executor:
+                downloaded_paths = dict(zip(urls, executor.map(download_func, urls)))
+        else:
+            downloaded_paths = {url: download_func(url) for url in urls}
+        downloaded_path_or_paths = map_nested(downloaded_paths.__getitem__, url_or_urls)
         self._record_sizes_checksums(url_or_urls, downloaded_path_or_paths)
         return downloaded_path_or_paths
 
@@ -146,6 +146,7 @@ class DownloadConfig:
             file in a folder along the archive.
         force_extract: if True when extract_compressed_file is True and the archive was already extracted,
             re-extract the archive and overide the folder where it was extracted.
+        num_threads: maximum number of files downloaded concurrently by the download manager.
 
 
     """
@@ -158,6 +159,7 @@ class DownloadConfig:
     user_agent: Optional[str] = None
     extract_compressed_file: bool = False
     force_extract: bool = False
+    num_threads: int = 8
 
 
 def cached_path(url_or_filename, download_config=None, **download_kwargs,) -> Optional[str]:
@@ -18,10 +18,15 @@
 
 """
 
+import atexit
 import contextlib
 import functools
+import glob
 import itertools
 import os
+import shutil
+import threading
+import uuid
 from io import BytesIO as StringIO
 from shutil import disk_usage
 from types import CodeType
@@ -239,6 +244,44 @@ def has_sufficient_disk_space(needed_bytes, directory="."):
     return needed_bytes < free_bytes
 
 
+# Removals started by rmtree_in_background, waited for at exit so that they are not killed with the interpreter.
+_rmtree_threads = set()
+
+
+@atexit.register
+def _join_rmtree_threads():
+    for thread in list(_rmtree_threads):
+        thread.join()
+
+
+def _rmtree_thread(path):
+    shutil.rmtree(path, ignore_errors=True)
+    _rmtree_threads.discard(threading.current_thread())
+
+
+def _start_rmtree_thread(path):
+    thread = threading.Thread(target=_rmtree_thread, args=(path,), daemon=True)
+    _rmtree_threads.add(thread)
+    thread.start()
+    return thread
+
+
+def rmtree_in_background(path):
+    """Rename `path` to a unique trash path and remove it recursively in a daemon thread.
+
+    The renaming is immediate, so `path` can be reused right away.
+    The removal is waited for when the interpreter exits.
+    """
+    trash_path = "{}.trash-{}".format(path, uuid.uuid4().hex)
+    os.rename(path, trash_path)
+    return _start_rmtree_thread(trash_path)
+
+
+def rmtree_leftover_trash(path):
+    """Remove in background the trash paths of `path` that a killed process didn't finish removing."""
+    return [_start_rmtree_thread(trash_path) for trash_path in glob.glob(glob.escape(path) + ".trash-*")]
+
+
 class Pickler(dill.Pickler):
     """Same Pickler as the one from dill, but improved for notebooks and shells"""
 
@@ -1,8 +1,11 @@
+import os
+import tempfile
 from unittest import TestCase
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 
-from nlp.arrow_reader import BaseReader
+from nlp.arrow_reader import BaseReader, ParquetReader
 from nlp.info import DatasetInfo
 from nlp.splits import SplitDict, SplitInfo
 
@@ -13,7 +16,7 @@ class ReaderTest(BaseReader):
     This reader is made for testing. It mocks file reads.
     """
 
-    def _get_dataset_from_filename(self, filename_skip_take):
+    def _get_dataset_from_filename(self, filename_skip_take, columns=None):
         """Returns a Dataset instance from given (filename, skip, take)."""
         filename, skip, take = (
             filename_skip_take["filename"],
@@ -25,6 +28,11 @@ class ReaderTest(BaseReader):
             pa_table = pa_table.slice(skip, take)
         return pa_table
 
+    def _iter_batches_from_filename(self, filename, columns=None):
+        """Yields the record batches of a mocked file, by chunks of 30 examples."""
+        pa_table = pa.Table.from_pydict({"filename": [filename] * 100, "index": list(range(100))})
+        return iter(pa_table.to_batches(max_chunksize=30))
+
 
 class BaseReaderTest(TestCase):
     def test_read(self):
@@ -67,3 +75,65 @@ class BaseReaderTest(TestCase):
         self.assertEqual(dset.num_rows, 110)
         self.assertEqual(dset.num_columns, 1)
         self.assertEqual(dset._data_files, files)
+
+    def test_read_streaming(self):
+        name = "my_name"
+        train_info = SplitInfo(name="train", num_examples=100)
+        test_info = SplitInfo(name="test", num_examples=100)
+        split_infos = [train_info, test_info]
+        split_dict = SplitDict()
+        split_dict.add(train_info)
+        split_dict.add(test_info)
+        info = DatasetInfo(splits=split_dict)
+        reader = ReaderTest("", info)
+
+        instructions = "test[25:70]+train[-10:]"
+        dset = reader.read(name, instructions, split_infos, streaming=True)
+        examples = list(dset)
+        self.assertEqual(len(examples), 55)
+        self.assertListEqual([ex["index"] for ex in examples[:45]], list(range(25, 70)))
+        self.assertListEqual([ex["index"] for ex in examples[45:]], list(range(90, 100)))
+        self.assertEqual(examples[0]["filename"], f"{name}-test")
+        self.assertEqual(examples[-1]["filename"], f"{name}-train")
+        # The dataset can be iterated over several times
+        self.assertEqual(len(list(dset)), 55)
+
+
+class ParquetReaderTest(TestCase):
+    def test_read_files_row_groups(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pa_table = pa.Table.from_pydict({"index": list(range(100))})
+            pq.write_table(pa_table, os.path.join(tmp_dir, "train.parquet"), row_group_size=30)
+            reader = ParquetReader(tmp_dir, DatasetInfo())
+            for skip, take in [(0, 100), (25, 45), (30, 30), (90, 10), (95, 0)]:
+                files = [{"filename": "train.parquet", "skip": skip, "take": take}]
+                dset = reader.read_files(files)
+                self.assertListEqual(dset["index"], list(range(skip, skip + take)))
+            dset = reader.read_files([{"filename": "train.parquet"}])
+            self.assertEqual(dset.num_rows, 100)
+
+    def test_read_files_columns(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pa_table = pa.Table.from_pydict({"index": list(range(100)), "text": ["foo"] * 100})
+            pq.write_table(pa_table, os.path.join(tmp_dir, "train.parquet"), row_group_size=30)
+            reader = ParquetReader(tmp_dir, DatasetInfo())
+            files = [{"filename": "train.parquet", "skip": 25, "take": 45}]
+            dset = reader.read_files(files, columns=["text"])
+            self.assertEqual(dset.num_rows, 45)
+            self.assertEqual(dset.num_columns, 1)
+            self.assertListEqual(dset["text"], ["foo"] * 45)
+            examples = list(reader.read_files(files, streaming=True, columns=["text"]))
+            self.assertListEqual(examples, [{"text": "foo"}] * 45)
+            with self.assertRaises(ValueError):
+                reader.read_files(files, columns=["text", "nope"])
+            with self.assertRaises(ValueError):
+                list(reader.read_files(files, streaming=True, columns=["nope"]))
+
+    def test_read_files_streaming(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pa_table = pa.Table.from_pydict({"index": list(range(100))})
+            pq.write_table(pa_table, os.path.join(tmp_dir, "train.parquet"), row_group_size=30)
+            reader = ParquetReader(tmp_dir, DatasetInfo())
+            files = [{"filename": "train.parquet", "skip": 25, "take": 45}, {"filename": "train.parquet"}]
+            dset = reader.read_files(files, streaming=True)
+            self.assertListEqual([ex["index"] for ex in dset], list(range(25, 70)) + list(range(100)))
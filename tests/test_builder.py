@@ -0,0 +1,120 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import pyarrow.parquet as pq
+
+from nlp.builder import BeamBasedBuilder, GeneratorBasedBuilder
+from nlp.features import ClassLabel, Features, Sequence, Value
+from nlp.info import DatasetInfo
+from nlp.splits import Split, SplitGenerator
+
+
+class DummyGeneratorBasedBuilder(GeneratorBasedBuilder):
+    def _info(self):
+        return DatasetInfo(
+            features=Features(
+                {"text": Value("string"), "label": ClassLabel(names=["x", "y"]), "ids": Sequence(Value("int32"))}
+            )
+        )
+
+    def _split_generators(self, dl_manager):
+        return [
+            SplitGenerator(name=Split.TRAIN, gen_kwargs={"num_examples": 300}),
+            SplitGenerator(name=Split.TEST, gen_kwargs={"num_examples": 20}),
+        ]
+
+    def _generate_examples(self, num_examples):
+        for i in range(num_examples):
+            yield i, {"text": "text %d" % i, "label": "y" if i % 2 else 0, "ids": [i, i + 1]}
+
+
+class DummyBuilderOverridingDownloadAndPrepare(DummyGeneratorBasedBuilder):
+    def _download_and_prepare(self, dl_manager, verify_infos):
+        super()._download_and_prepare(dl_manager, verify_infos)
+
+
+class DummyBeamBasedBuilder(BeamBasedBuilder):
+    def _info(self):
+        return DatasetInfo(
+            features=Features(
+                {"text": Value("string"), "label": ClassLabel(names=["x", "y"]), "ids": Sequence(Value("int32"))}
+            )
+        )
+
+    def _split_generators(self, dl_manager):
+        return [
+            SplitGenerator(name=Split.TRAIN, gen_kwargs={"num_examples": 300}),
+            SplitGenerator(name=Split.TEST, gen_kwargs={"num_examples": 20}),
+        ]
+
+    def _build_pcollection(self, pipeline, num_examples):
+        import apache_beam as beam
+
+        examples = [
+            (i, {"text": "text %d" % i, "label": "y" if i % 2 else "x", "ids": [i, i + 1]})
+            for i in range(num_examples)
+        ]
+        return pipeline | "Load examples" >> beam.Create(examples)
+
+
+class DummyBeamBasedBuilderWithoutEncoding(DummyBeamBasedBuilder):
+    def _info(self):
+        return DatasetInfo(features=Features({"text": Value("string"), "tokens": [Value("string")]}))
+
+    def _build_pcollection(self, pipeline, num_examples):
+        import apache_beam as beam
+
+        examples = [(i, {"text": "text %d" % i, "tokens": ["text", str(i)]}) for i in range(num_examples)]
+        return pipeline | "Load examples" >> beam.Create(examples)
+
+
+class GeneratorBasedBuilderTest(TestCase):
+    def test_download_and_prepare_num_proc(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            builder = DummyGeneratorBasedBuilder(cache_dir=os.path.join(tmp_dir, "sequential"))
+            builder.download_and_prepare()
+            builder_mp = DummyGeneratorBasedBuilder(cache_dir=os.path.join(tmp_dir, "multiprocessing"))
+            builder_mp.download_and_prepare(num_proc=2)
+            self.assertDictEqual(builder_mp.info.features, builder.info.features)
+            for split in ["train", "test"]:
+                split_info, split_info_mp = builder.info.splits[split], builder_mp.info.splits[split]
+                self.assertEqual(split_info_mp.num_examples, split_info.num_examples)
+                self.assertEqual(split_info_mp.num_bytes, split_info.num_bytes)
+                self.assertEqual(builder_mp.as_dataset(split=split)[:], builder.as_dataset(split=split)[:])
+            self.assertEqual(builder_mp.info.splits["train"].num_examples, 300)
+            self.assertEqual(builder_mp.info.splits["test"].num_examples, 20)
+
+    def test_download_and_prepare_overridden(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            builder = DummyBuilderOverridingDownloadAndPrepare(cache_dir=tmp_dir)
+            builder.download_and_prepare()
+            self.assertEqual(builder.info.splits["train"].num_examples, 300)
+            self.assertEqual(builder.as_dataset(split="test").num_rows, 20)
+
+
+class BeamBasedBuilderTest(TestCase):
+    def _check_prepared_splits(self, builder, expected_example):
+        for split, num_examples in [("train", 300), ("test", 20)]:
+            self.assertEqual(builder.info.splits[split].num_examples, num_examples)
+            dset = builder.as_dataset(split=split)
+            self.assertEqual(dset.num_rows, num_examples)
+            examples = sorted((dset[i] for i in range(dset.num_rows)), key=lambda ex: ex["text"])
+            expected_examples = sorted((expected_example(i) for i in range(num_examples)), key=lambda ex: ex["text"])
+            self.assertListEqual(examples, expected_examples)
+
+    def test_download_and_prepare(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            builder = DummyBeamBasedBuilder(cache_dir=tmp_dir)
+            self.assertTrue(builder.info.features.requires_encoding())
+            builder.download_and_prepare()
+            self._check_prepared_splits(builder, lambda i: {"text": "text %d" % i, "label": i % 2, "ids": [i, i + 1]})
+            parquet_file = pq.ParquetFile(os.path.join(builder.cache_dir, "dummy_beam_based_builder-train.parquet"))
+            self.assertEqual(parquet_file.metadata.row_group(0).column(0).compression, "ZSTD")
+
+    def test_download_and_prepare_without_encoding(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            builder = DummyBeamBasedBuilderWithoutEncoding(cache_dir=tmp_dir)
+            self.assertFalse(builder.info.features.requires_encoding())
+            builder.download_and_prepare()
+            self._check_prepared_splits(builder, lambda i: {"text": "text %d" % i, "tokens": ["text", str(i)]})
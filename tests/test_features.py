@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+import pyarrow as pa
+
+from nlp.features import ClassLabel, Features, Sequence, Value
+
+
+class FeaturesTest(TestCase):
+    def test_encode_batch(self):
+        features = Features(
+            {
+                "text": Value("string"),
+                "label": ClassLabel(names=["negative", "positive"]),
+                "ids": Sequence(Value("int32")),
+                "answers": Sequence({"text": Value("string"), "start": Value("int32")}),
+            }
+        )
+        batch = [
+            {"text": "foo", "label": "positive", "ids": [1, 2], "answers": [{"text": "f", "start": 0}]},
+            {"text": "bar", "label": 0, "ids": [], "answers": {"text": ["b", "r"], "start": [0, 2]}},
+        ]
+        encoded_batch = features.encode_batch(batch)
+        self.assertDictEqual(
+            encoded_batch,
+            {
+                "text": ["foo", "bar"],
+                "label": [1, 0],
+                "ids": [[1, 2], []],
+                "answers": [{"text": ["f"], "start": [0]}, {"text": ["b", "r"], "start": [0, 2]}],
+            },
+        )
+        for i, example in enumerate(batch):
+            encoded_example = features.encode_example(example)
+            self.assertDictEqual(encoded_example, {key: column[i] for key, column in encoded_batch.items()})
+
+    def test_value_encode_batch(self):
+        for dtype, values in [
+            ("int32", ["1", 2.0]),
+            ("float64", ["0.5", 1]),
+            ("bool", [0, 1]),
+            ("string", ["a", "b"]),
+        ]:
+            feature = Value(dtype)
+            self.assertListEqual(feature.encode_batch(values), [feature.encode_example(value) for value in values])
+
+    def test_requires_encoding(self):
+        features = Features({"text": Value("string"), "ids": [Value("string")], "meta": {"title": Value("string")}})
+        self.assertFalse(features.requires_encoding())
+        for feature in [
+            Value("int32"),
+            ClassLabel(names=["negative", "positive"]),
+            Sequence({"text": Value("string")}),
+            {"tokens": Sequence(Value("float32"))},
+        ]:
+            self.assertTrue(Features({"text": Value("string"), "feature": feature}).requires_encoding())
+
+    def test_from_arrow_schema(self):
+        pa_schema = pa.schema(
+            {
+                "text": pa.string(),
+                "score": pa.float64(),
+                "ids": pa.list_(pa.int32()),
+                "meta": pa.struct({"id": pa.int64(), "tags": pa.list_(pa.string())}),
+            }
+        )
+        features = Features.from_arrow_schema(pa_schema)
+        self.assertDictEqual(
+            features,
+            {
+                "text": Value("string"),
+                "score": Value("float64"),
+                "ids": [Value("int32")],
+                "meta": {"id": Value("int64"), "tags": [Value("string")]},
+            },
+        )
+        self.assertEqual(features.type, pa.struct(list(pa_schema)))
@@ -0,0 +1,32 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from nlp.info import DATASET_INFO_FILENAME, DatasetInfo
+
+
+class DatasetInfoTest(TestCase):
+    def test_from_directory_rewritten_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            DatasetInfo(description="foo").write_to_directory(tmp_dir)
+            self.assertEqual(DatasetInfo.from_directory(tmp_dir).description, "foo")
+            self.assertEqual(DatasetInfo.from_directory(tmp_dir).description, "foo")
+
+            # Regenerate the info file with the same size and modification time, as a new file
+            info_path = os.path.join(tmp_dir, DATASET_INFO_FILENAME)
+            stat = os.stat(info_path)
+            new_dir = os.path.join(tmp_dir, "new")
+            os.makedirs(new_dir)
+            DatasetInfo(description="bar").write_to_directory(new_dir)
+            new_info_path = os.path.join(new_dir, DATASET_INFO_FILENAME)
+            os.utime(new_info_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(new_info_path, info_path)
+            self.assertEqual(os.stat(info_path).st_size, stat.st_size)
+            self.assertEqual(DatasetInfo.from_directory(tmp_dir).description, "bar")
+
+    def test_from_directory_returns_new_objects(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            DatasetInfo(description="foo").write_to_directory(tmp_dir)
+            info = DatasetInfo.from_directory(tmp_dir)
+            info.description = "bar"
+            self.assertEqual(DatasetInfo.from_directory(tmp_dir).description, "foo")
@@ -0,0 +1,33 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from nlp.utils import download_manager
+from nlp.utils.download_manager import DownloadManager
+from nlp.utils.file_utils import DownloadConfig, cached_path
+
+
+class DownloadManagerTest(TestCase):
+    def test_download(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i in range(3):
+                path = os.path.join(tmp_dir, "file_%d.txt" % i)
+                with open(path, "w") as f:
+                    f.write("foo" * i)
+                paths.append(path)
+            url_or_urls = {"train": [paths[0], paths[1]], "test": [paths[2], paths[0]]}
+
+            for num_threads in [8, 1]:
+                download_config = DownloadConfig(cache_dir=os.path.join(tmp_dir, "downloads"), num_threads=num_threads)
+                dl_manager = DownloadManager(download_config=download_config)
+                with patch.object(download_manager, "cached_path", wraps=cached_path) as mock_cached_path:
+                    downloaded_paths = dl_manager.download(url_or_urls)
+                self.assertDictEqual(downloaded_paths, url_or_urls)
+                self.assertEqual(mock_cached_path.call_count, 3)
+                self.assertSetEqual({call[0][0] for call in mock_cached_path.call_args_list}, set(paths))
+                self.assertSetEqual(set(dl_manager.get_recorded_sizes_checksums()), set(paths))
+
+                self.assertListEqual(dl_manager.download([paths[1], paths[1]]), [paths[1], paths[1]])
+                self.assertEqual(dl_manager.download(paths[2]), paths[2])
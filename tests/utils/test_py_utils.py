@@ -1,9 +1,15 @@
+import os
+import subprocess
+import sys
+import tempfile
 from unittest import TestCase
 
 from nlp.utils.py_utils import (
     flatten_nest_dict,
     flatten_nested,
     map_nested,
+    rmtree_in_background,
+    rmtree_leftover_trash,
     temporary_assignment,
     zip_dict,
     zip_nested,
@@ -93,3 +99,38 @@ class PyUtilsTest(TestCase):
         with temporary_assignment(foo, "my_attr", "BAR"):
             self.assertEqual(foo.my_attr, "BAR")
         self.assertEqual(foo.my_attr, "bar")
+
+    def test_rmtree_in_background(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dirname = os.path.join(tmp_dir, "foo")
+            os.makedirs(os.path.join(dirname, "bar"))
+            with open(os.path.join(dirname, "bar", "baz.txt"), "w") as f:
+                f.write("baz")
+            thread = rmtree_in_background(dirname)
+            self.assertFalse(os.path.exists(dirname))
+            thread.join()
+            self.assertListEqual(os.listdir(tmp_dir), [])
+
+    def test_rmtree_in_background_at_exit(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dirname = os.path.join(tmp_dir, "foo")
+            script = (
+                "import os\n"
+                "from nlp.utils.py_utils import rmtree_in_background\n"
+                "for i in range(1000):\n"
+                "    os.makedirs(os.path.join({dirname!r}, str(i)))\n"
+                "rmtree_in_background({dirname!r})\n"
+            ).format(dirname=dirname)
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+            subprocess.run([sys.executable, "-c", script], check=True, env=env)
+            self.assertListEqual(os.listdir(tmp_dir), [])
+
+    def test_rmtree_leftover_trash(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dirname = os.path.join(tmp_dir, "foo")
+            os.makedirs(os.path.join(dirname + ".trash-123", "bar"))
+            os.makedirs(os.path.join(dirname + ".trash-456"))
+            os.makedirs(dirname)
+            for thread in rmtree_leftover_trash(dirname):
+                thread.join()
+            self.assertListEqual(os.listdir(tmp_dir), ["foo"])